@@ -1,3 +1,3 @@
 """
-Pacote de módulos principais para o aplicativo de transcrição.
+Core modules package for the transcription application.
 """
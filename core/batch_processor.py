@@ -3,10 +3,48 @@ Batch processing module for the transcription application.
 """
 import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 
+from core.file_manager import FileManager
+from core.transcriber import load_audio
+
+# Minimum seconds between item_progress emissions that only change the
+# status text of the same item.
+PROGRESS_EMIT_INTERVAL = 0.1
+
+class ProgressThrottle:
+    """
+    Decides which progress updates are worth a queued call into the GUI
+    thread. Every change of percentage goes through, so phase changes such
+    as "Loading model" -> "Analyzing audio" are never lost; updates that
+    repeat the last percentage are limited to one per interval.
+    """
+    def __init__(self, interval=PROGRESS_EMIT_INTERVAL):
+        self.interval = interval
+        self.last_percent = None
+        self.last_emit = 0.0
+    
+    def should_emit(self, percent):
+        """
+        Returns True if an update at this percentage should be emitted.
+        
+        Args:
+            percent (int): Progress percentage of the update
+        
+        Returns:
+            bool: Whether to emit it
+        """
+        now = time.monotonic()
+        if percent == self.last_percent and now - self.last_emit < self.interval:
+            return False
+        self.last_percent = percent
+        self.last_emit = now
+        return True
+
 class BatchProcessorSignals(QObject):
     """
     Signals for communication with the interface during batch processing.
@@ -21,25 +59,36 @@ class BatchProcessorSignals(QObject):
 class BatchProcessor:
     """
     Class for managing batch processing.
+
+    Transcription runs ahead of the user: while one result waits for
+    confirmation, the next items are already being transcribed. The
+    transcriber holds a single model, so transcriptions themselves still
+    run one at a time.
     """
-    def __init__(self, transcriber):
+    def __init__(self, transcriber, parent=None):
         self.transcriber = transcriber
         self.batch_thread = None
+        self.transcription_thread = None
         self.is_processing = False
         self.cancel_requested = False
         self.pause_requested = False
-        self.current_item_index = -1
-        self.items_queue = Queue()
+        self.current_item_index = -1  # item being transcribed
+        self.confirming_index = -1  # item waiting for confirmation
+        self.canceled_items = set()  # indexes passed to cancel_item
         self.results = {}
-        self.signals = BatchProcessorSignals()
-        self.waiting_confirmation = False
+        # Parented to the GUI-side owner so its lifetime and thread affinity follow it
+        self.signals = BatchProcessorSignals(parent)
+        # Set when the current item may be released (confirmed, failed or canceled).
+        self._confirmation_event = threading.Event()
+        # (file_path, text) the user chose to save, written by the batch thread
+        self._pending_save = None
     
     def process_batch(self, items, config):
         """
         Starts batch processing.
         
         Args:
-            items (list): List of items (file paths)
+            items (iterable): Items (file paths); a generator is consumed lazily
             config (dict): Transcription settings
         """
         if self.is_processing:
@@ -50,15 +99,10 @@ class BatchProcessor:
         self.cancel_requested = False
         self.pause_requested = False
         self.current_item_index = -1
+        self.confirming_index = -1
+        self.canceled_items = set()
         self.results = {}
-        self.waiting_confirmation = False
-        
-        # Clear and populate the queue
-        while not self.items_queue.empty():
-            self.items_queue.get()
-        
-        for item in items:
-            self.items_queue.put(item)
+        self._confirmation_event.clear()
         
         # Start batch processing thread
         self.batch_thread = threading.Thread(
@@ -70,42 +114,55 @@ class BatchProcessor:
     
     def _batch_thread(self, items, config):
         """
-        Batch processing thread.
+        Batch processing thread. Starts the transcription worker and hands
+        its results to the user for confirmation, one at a time.
         
         Args:
-            items (list): List of items (file paths)
+            items (iterable): Items (file paths); a generator is consumed lazily
             config (dict): Transcription settings
         """
+        transcribed = Queue()
+        
         try:
-            total_items = len(items)
-            processed_items = 0
+            self.transcription_thread = threading.Thread(
+                target=self._transcription_thread,
+                args=(items, config, transcribed)
+            )
+            self.transcription_thread.daemon = True
+            self.transcription_thread.start()
             
-            while not self.items_queue.empty() and not self.cancel_requested:
-                # Get next item
-                item = self.items_queue.get()
-                self.current_item_index += 1
-                
-                # Update batch progress
-                batch_progress = int((processed_items / total_items) * 100)
-                self.signals.batch_progress.emit(
-                    batch_progress, 
-                    f"Processing item {processed_items + 1} of {total_items}: {os.path.basename(item)}"
-                )
-                
-                # Process media file
-                self._process_media_file(item, config)
+            while not self.cancel_requested:
+                entry = transcribed.get()
+                if entry is None:
+                    break
                 
-                # Wait for confirmation before proceeding
-                self.waiting_confirmation = True
-                while self.waiting_confirmation and not self.cancel_requested:
-                    # Wait for user confirmation
-                    threading.Event().wait(0.1)
+                index, file_path, text = entry
+                if text is None:
+                    # Failed or skipped; the error was already reported
+                    continue
                 
-                processed_items += 1
+                # Request user confirmation and wait for it
+                self.confirming_index = index
+                self._pending_save = None
+                self._confirmation_event.clear()
                 
-                # Check for cancellation after each item
+                # A cancel that landed since get() set the event just cleared;
+                # look again instead of asking about a canceled item
                 if self.cancel_requested:
                     break
+                if index in self.canceled_items:
+                    continue
+                
+                self.signals.confirmation_needed.emit(index, file_path, text)
+                self._confirmation_event.wait()
+                
+                # Write here rather than in confirm_and_continue, which runs
+                # on the GUI thread. confirm_and_continue ignores answers that
+                # arrive after a cancel, so a pending save was confirmed
+                # first and a "save and stop" is still honored.
+                pending, self._pending_save = self._pending_save, None
+                if pending and index not in self.canceled_items:
+                    self._save_result(index, *pending)
             
             # Finalize batch processing
             if not self.cancel_requested:
@@ -113,45 +170,131 @@ class BatchProcessor:
         
         except Exception as e:
             self.signals.error_occurred.emit(f"Error in batch processing: {str(e)}")
+            self.cancel()
         
         finally:
+            # Let a canceled transcription wind down before accepting a new batch
+            if self.transcription_thread:
+                self.transcription_thread.join()
             self.is_processing = False
     
-    def _process_media_file(self, file_path, config):
+    def _transcription_thread(self, items, config, transcribed):
         """
-        Processes a media file.
+        Transcription worker thread. Transcribes the items in order and
+        pushes (index, path, text) entries to `transcribed`, followed by None.
         
         Args:
-            file_path (str): Path to the media file
+            items (iterable): Items (file paths); a generator is consumed lazily
             config (dict): Transcription settings
+            transcribed (Queue): Destination for finished items
         """
-        if not os.path.isfile(file_path):
-            self.signals.error_occurred.emit(f"File not found: {file_path}")
-            return
+        # On CUDA the CPU is mostly idle during inference, so the next file
+        # is decoded while the current one transcribes. On CPU decoding
+        # would compete with the inference threads, so it is left inline.
+        decoder = ThreadPoolExecutor(max_workers=1) if config.get("device") == "cuda" else None
+        
+        try:
+            # Streamed items (e.g. a folder scan) have no length up front
+            total_items = len(items) if hasattr(items, "__len__") else None
+            
+            upcoming = enumerate(items)
+            current = next(upcoming, None)
+            current_audio = None
+            
+            while current is not None and not self.cancel_requested:
+                index, item = current
+                self.current_item_index = index
+                
+                # Update batch progress
+                name = os.path.basename(item)
+                if total_items:
+                    batch_progress = (index * 100) // total_items
+                    message = f"Processing item {index + 1} of {total_items}: {name}"
+                else:
+                    batch_progress = 0
+                    message = f"Processing item {index + 1}: {name}"
+                self.signals.batch_progress.emit(batch_progress, message)
+                
+                # Start decoding the next item before this one is transcribed
+                following = next(upcoming, None)
+                following_audio = None
+                if decoder and following is not None:
+                    following_audio = decoder.submit(load_audio, following[1])
+                
+                # Process media file
+                text = self._process_media_file(item, config, self._decoded(current_audio))
+                transcribed.put((index, item, text))
+                
+                current, current_audio = following, following_audio
+        
+        except Exception as e:
+            self.signals.error_occurred.emit(f"Error in batch processing: {str(e)}")
+        
+        finally:
+            if decoder:
+                # A decode still running after a cancel is simply dropped
+                decoder.shutdown(wait=False)
+            transcribed.put(None)
+    
+    @staticmethod
+    def _decoded(future):
+        """
+        Returns the audio decoded ahead of time, or None to let the
+        transcriber read the file itself (and report any error).
         
-        self.signals.item_progress.emit(self.current_item_index, 0, "Starting transcription...")
+        Args:
+            future (Future): Pending load_audio call, or None
+            
+        Returns:
+            numpy.ndarray: Audio samples, or None
+        """
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+    
+    def _process_media_file(self, file_path, config, audio=None):
+        """
+        Processes a media file, blocking until its transcription ends.
+        
+        Args:
+            file_path (str): Path to the media file
+            config (dict): Transcription settings
+            audio (numpy.ndarray): The file already decoded, if available
+            
+        Returns:
+            str: Transcribed text, or None if it failed or was canceled
+        """
+        # Existence is checked once, by the transcriber, which reports a
+        # missing file through error_callback.
+        index = self.current_item_index
+        result = {}
+        self.signals.item_progress.emit(index, 0, "Starting transcription...")
         
         # Configure callbacks for transcription
+        throttle = ProgressThrottle()
+        
         def transcribe_progress(percent, status=None):
+            # Coalesce updates: each emit is a queued call into the GUI thread
+            if not throttle.should_emit(percent):
+                return
             self.signals.item_progress.emit(
-                self.current_item_index, 
+                index, 
                 percent, 
                 status or f"Transcription: {percent}%"
             )
         
         def transcribe_complete(text):
-            self.signals.item_progress.emit(self.current_item_index, 100, "Transcription completed")
+            self.signals.item_progress.emit(index, 100, "Transcription completed")
             
             # Store result
             self.results[file_path] = text
-            
-            # Request user confirmation
-            self.signals.confirmation_needed.emit(self.current_item_index, file_path, text)
+            result["text"] = text
         
         def transcribe_error(error_msg):
             self.signals.error_occurred.emit(error_msg)
-            # Proceed to the next item
-            self.waiting_confirmation = False
         
         # Start transcription
         self.transcriber.transcribe(
@@ -159,36 +302,58 @@ class BatchProcessor:
             config,
             progress_callback=transcribe_progress,
             completion_callback=transcribe_complete,
-            error_callback=transcribe_error
+            error_callback=transcribe_error,
+            audio=audio
         )
+        
+        # A batch cancel may have landed just before this transcription started
+        if self.cancel_requested:
+            self.transcriber.cancel()
+        
+        # The transcriber goes idle on completion, error and cancel alike
+        self.transcriber.wait()
+        
+        return result.get("text")
+    
+    def _save_result(self, index, file_path, text):
+        """
+        Saves a transcription next to its source file.
+        
+        Args:
+            index (int): Item index
+            file_path (str): Path to the processed file
+            text (str): Transcribed text
+        """
+        try:
+            # The transcript goes next to the source file
+            output_path = str(Path(file_path).with_suffix(".txt"))
+            
+            # Save the file
+            FileManager.write_text_atomic(text, output_path)
+            
+            # Notify item completion
+            self.signals.item_completed.emit(index, file_path, output_path)
+        except Exception as e:
+            self.signals.error_occurred.emit(f"Error saving file: {str(e)}")
     
     def confirm_and_continue(self, save=True, file_path=None, text=None):
         """
         Confirms processing of the current item and continues to the next.
+        The file is written by the batch thread, not the caller's.
         
         Args:
             save (bool): If True, saves the text file
             file_path (str): Path to the processed file
             text (str): Transcribed text
         """
-        if save and file_path and text:
-            try:
-                # Determine directory and file name
-                output_dir = os.path.dirname(file_path)
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
-                output_path = os.path.join(output_dir, f"{base_name}.txt")
-                
-                # Save the file
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(text)
-                
-                # Notify item completion
-                self.signals.item_completed.emit(self.current_item_index, file_path, output_path)
-            except Exception as e:
-                self.signals.error_occurred.emit(f"Error saving file: {str(e)}")
+        # Once a cancel has released the item, a late answer from the
+        # dialog must not save it
+        released = self.cancel_requested or self._confirmation_event.is_set()
+        if save and file_path and text and not released:
+            self._pending_save = (file_path, text)
         
         # Continue to the next item
-        self.waiting_confirmation = False
+        self._confirmation_event.set()
     
     def cancel(self):
         """
@@ -199,7 +364,7 @@ class BatchProcessor:
         """
         if self.is_processing:
             self.cancel_requested = True
-            self.waiting_confirmation = False
+            self._confirmation_event.set()
             
             # Cancel ongoing operations
             if self.transcriber.is_transcribing:
@@ -219,16 +384,58 @@ class BatchProcessor:
         Returns:
             bool: True if cancellation was initiated, False otherwise
         """
-        if self.is_processing and index == self.current_item_index:
+        if not self.is_processing:
+            return False
+        
+        # Recorded for the batch thread, which checks it before asking for
+        # confirmation and before saving
+        self.canceled_items.add(index)
+        
+        if index == self.confirming_index:
+            # Skip confirmation and proceed to the next item
+            self._confirmation_event.set()
+            return True
+        
+        if index == self.current_item_index:
             # Cancel current operation
             if self.transcriber.is_transcribing:
                 self.transcriber.cancel()
-            
-            # Proceed to the next item
-            self.waiting_confirmation = False
-            
             return True
         
         return False
 
 
+if __name__ == "__main__":
+    # Smallest runnable check: a batch waiting for confirmation must end
+    # when it is canceled (what closing the confirmation box does), and
+    # must accept a new batch afterwards.
+    class _FakeTranscriber:
+        is_transcribing = False
+        def transcribe(self, file_path, config, progress_callback=None, completion_callback=None,
+                       error_callback=None, audio=None):
+            completion_callback(f"text of {file_path}")
+        def wait(self):
+            pass
+        def cancel(self):
+            return False
+    
+    processor = BatchProcessor(_FakeTranscriber())
+    asked = threading.Event()
+    processor.signals.confirmation_needed.connect(lambda index, path, text: asked.set())
+    processor.process_batch(["a.wav", "b.wav"], {})
+    assert asked.wait(5), "no confirmation requested"
+    assert processor.cancel()
+    processor.batch_thread.join(5)
+    assert not processor.batch_thread.is_alive() and not processor.is_processing
+    
+    # An answer that arrives after the cancel must not save the item
+    saved = []
+    processor.signals.item_completed.connect(lambda index, path, output: saved.append(path))
+    asked.clear()
+    processor.process_batch(["a.wav"], {})
+    assert asked.wait(5), "no confirmation requested"
+    processor.cancel()
+    processor.confirm_and_continue(True, "a.wav", "late answer")
+    processor.batch_thread.join(5)
+    assert not saved and not processor.is_processing
+    print("batch processor self-check OK")
@@ -2,8 +2,59 @@
 File management module for the transcription application.
 """
 import os
-import shutil
 from pathlib import Path
+from urllib.parse import urlparse
+
+# Transcripts are written in one go; a large buffer keeps that to a single
+# write() syscall instead of one per default-sized (8 KB) chunk.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Extensions (lowercase, with dot) accepted as audio/video input.
+MEDIA_EXTENSIONS = frozenset({
+    ".mp3", ".mp4", ".wav", ".ogg", ".flac",
+    ".avi", ".mov", ".mkv", ".webm", ".m4a"
+})
+
+_YOUTUBE_DOMAINS = (
+    "youtube.com", "www.youtube.com",
+    "youtu.be", "www.youtu.be",
+    "m.youtube.com"
+)
+
+# Common spellings, matched with a plain startswith before parsing the URL.
+_YOUTUBE_PREFIXES = tuple(
+    f"{scheme}://{domain}/" for scheme in ("https", "http") for domain in _YOUTUBE_DOMAINS
+)
+
+
+def _iter_media_files(folder_path):
+    """
+    Yields media file paths under a folder, depth first. Uses os.scandir so
+    the file/dir checks come from the directory listing, without an extra
+    stat per entry, and an explicit stack instead of recursion, so deep
+    trees neither hit the recursion limit nor pass every path up through
+    a chain of generators. Unreadable folders are skipped, as os.walk would.
+    """
+    pending = [folder_path]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        
+        subfolders = []
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS:
+                        yield entry.path
+                except OSError:
+                    continue
+        
+        # Reversed, so subfolders are visited in listing order
+        pending.extend(reversed(subfolders))
 
 class FileManager:
     """
@@ -20,16 +71,9 @@ class FileManager:
         Returns:
             bool: True if it's a valid media file, False otherwise
         """
-        if not os.path.isfile(file_path):
-            return False
-        
-        valid_extensions = [
-            ".mp3", ".mp4", ".wav", ".ogg", ".flac", 
-            ".avi", ".mov", ".mkv", ".webm", ".m4a"
-        ]
-        
+        # Check the extension first: it is free, the stat is a syscall
         _, ext = os.path.splitext(file_path)
-        return ext.lower() in valid_extensions
+        return ext.lower() in MEDIA_EXTENSIONS and os.path.isfile(file_path)
     
     @staticmethod
     def is_youtube_url(url):
@@ -42,17 +86,12 @@ class FileManager:
         Returns:
             bool: True if it's a valid YouTube URL, False otherwise
         """
-        youtube_domains = [
-            "youtube.com", "www.youtube.com", 
-            "youtu.be", "www.youtu.be",
-            "m.youtube.com"
-        ]
-        
         try:
-            from urllib.parse import urlparse
-            parsed_url = urlparse(url)
-            return any(domain in parsed_url.netloc for domain in youtube_domains)
-        except:
+            if url.lower().startswith(_YOUTUBE_PREFIXES):
+                return True
+            netloc = urlparse(url).netloc.lower()
+            return any(domain in netloc for domain in _YOUTUBE_DOMAINS)
+        except Exception:
             return False
     
     @staticmethod
@@ -93,7 +132,38 @@ class FileManager:
         Returns:
             str: File name without extension
         """
-        return os.path.splitext(os.path.basename(file_path))[0]
+        return Path(file_path).stem
+    
+    @staticmethod
+    def write_text_atomic(text, file_path):
+        """
+        Writes text to a file via a temporary sibling file renamed over the
+        target, so a crash never leaves a truncated file behind.
+        
+        Args:
+            text (str): Text to be saved
+            file_path (str): File path
+            
+        Raises:
+            OSError: If the file cannot be written
+        """
+        # Encode in one pass and write the bytes, rather than going through
+        # the text layer's chunked encoder. Keep text mode's newline style.
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        data = text.encode("utf-8")
+        
+        tmp_path = f"{file_path}.tmp"
+        try:
+            with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
     
     @staticmethod
     def save_text_file(text, file_path):
@@ -112,13 +182,29 @@ class FileManager:
             os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
             
             # Save the file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(text)
+            FileManager.write_text_atomic(text, file_path)
             
             return True
         except Exception:
             return False
     
+    @staticmethod
+    def iter_media_files_in_folder(folder_path):
+        """
+        Yields media files in a folder as they are found, so a consumer
+        (e.g. BatchProcessor.process_batch) can start before the scan ends.
+        
+        Args:
+            folder_path (str): Folder path
+            
+        Yields:
+            str: Media file path
+        """
+        if not os.path.isdir(folder_path):
+            return
+        
+        yield from _iter_media_files(folder_path)
+    
     @staticmethod
     def find_media_files_in_folder(folder_path):
         """
@@ -130,20 +216,6 @@ class FileManager:
         Returns:
             list: List of media file paths
         """
-        if not os.path.isdir(folder_path):
-            return []
-        
-        media_extensions = [
-            ".mp3", ".mp4", ".wav", ".ogg", ".flac", 
-            ".avi", ".mov", ".mkv", ".webm", ".m4a"
-        ]
-        
-        media_files = []
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                if any(file.lower().endswith(ext) for ext in media_extensions):
-                    media_files.append(os.path.join(root, file))
-        
-        return media_files
+        return list(FileManager.iter_media_files_in_folder(folder_path))
 
 
@@ -6,83 +6,280 @@ quantization, uses a fraction of the RAM, needs no PyTorch, and bundles
 its own ffmpeg via PyAV. It also yields segments with timestamps, which
 lets us report *real* progress instead of a fixed fake curve.
 """
+import functools
 import os
 import threading
 import time
-from faster_whisper import WhisperModel
+from collections import OrderedDict
+from queue import Queue
+
+# faster-whisper, CTranslate2 and NumPy are imported where they are used,
+# which is always on the worker thread: importing them takes a second or
+# more, and doing it at module level would delay the main window.
 
 # UI passes "large"; faster-whisper's best large checkpoint is "large-v3".
 _MODEL_ALIASES = {"large": "large-v3"}
 
+# Loaded models shared by all Transcriber instances, keyed by the requested
+# (model_name, device, precision) and kept in least-recently-used order. Each entry is
+# (model, actual_device), since a CUDA request may have fallen back to CPU.
+# Models are hundreds of MB, so only a couple stay resident.
+_MODEL_CACHE_SIZE = 2
+_model_cache = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+# CUDA compute types in order of preference. bfloat16 (Ampere+) has the same
+# Tensor Core throughput as float16 but fp32's range, so no overflow risk.
+_CUDA_COMPUTE_TYPES = ("int8_bfloat16", "int8_float16", "float16")
+
+# VAD chunks decoded per forward pass on CUDA, unless config["batch_size"]
+# says otherwise. 16 is faster-whisper's own recommendation and fits the
+# large models in 8 GB of VRAM with int8 weights.
+DEFAULT_BATCH_SIZE = 16
+
+
+def _compute_type(device, precision="auto"):
+    """
+    Picks the CTranslate2 compute type for a device. With precision "auto":
+    int8 weights on CPU; on CUDA, int8 weights with bfloat16 or float16
+    activations, whichever the GPU supports first in _CUDA_COMPUTE_TYPES.
+    With precision "full" the weights are not quantized (float16 on CUDA,
+    float32 on CPU), for audio where int8 costs accuracy.
+    """
+    if precision == "full":
+        return "float16" if device == "cuda" else "float32"
+    if device != "cuda":
+        return "int8"
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types("cuda")
+    except Exception:
+        return "float16"
+    return next((ct for ct in _CUDA_COMPUTE_TYPES if ct in supported), "float16")
+
+
+@functools.lru_cache(maxsize=1)
+def cuda_available():
+    """
+    Returns True if CTranslate2 can see at least one CUDA device. Probed once
+    per process; the device count does not change while the app runs.
+    """
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
+def _cpu_threads():
+    """
+    Number of CTranslate2 threads for CPU inference. faster-whisper defaults
+    to 4; use about one per physical core (logical count / 2 for SMT) so big
+    machines are not left idle.
+    """
+    return max(4, (os.cpu_count() or 4) // 2)
+
+
+def _build_model(model_name, device, precision):
+    from faster_whisper import WhisperModel
+    resolved = _MODEL_ALIASES.get(model_name, model_name)
+    return WhisperModel(
+        resolved, device=device, compute_type=_compute_type(device, precision), cpu_threads=_cpu_threads()
+    )
+
+
+def _warm_up(model):
+    """
+    Runs one second of silence through a freshly loaded GPU model, so CUDA
+    context and cuBLAS/cuDNN setup happen while the UI says "Loading model"
+    instead of stalling the first file at 10%.
+    """
+    try:
+        import numpy as np
+        segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), language="en", beam_size=1)
+        for _ in segments:
+            pass
+    except Exception:
+        pass  # warm-up is best effort
+
+
+def _get_model(model_name, device, precision="auto"):
+    """
+    Returns (model, actual_device) from the shared cache, loading the model
+    on a miss. Falls back to CPU if a CUDA load fails (e.g. no NVIDIA
+    runtime present), reusing a cached CPU model when there is one.
+    """
+    key = (model_name, device, precision)
+    with _model_cache_lock:
+        entry = _model_cache.get(key)
+        if entry is None and device == "cpu":
+            # A CUDA request that fell back already loaded this CPU model
+            fallback = _model_cache.get((model_name, "cuda", precision))
+            if fallback and fallback[1] == "cpu":
+                entry = fallback
+        if entry is None:
+            try:
+                entry = (_build_model(model_name, device, precision), device)
+                if device == "cuda":
+                    _warm_up(entry[0])
+            except Exception:
+                if device == "cpu":
+                    raise
+                # CUDA requested but unavailable -> fall back to CPU int8.
+                cpu_entry = _model_cache.get((model_name, "cpu", precision))
+                entry = cpu_entry or (_build_model(model_name, "cpu", precision), "cpu")
+
+        _model_cache[key] = entry
+        _model_cache.move_to_end(key)
+        while len(_model_cache) > _MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+
+        return entry
+
+
+def load_audio(file_path):
+    """
+    Decodes a media file to the 16 kHz mono float32 samples the model
+    takes, so a caller can decode the next file while the current one is
+    being transcribed.
+
+    Args:
+        file_path (str): Path to the audio/video file
+
+    Returns:
+        numpy.ndarray: Audio samples
+    """
+    from faster_whisper import decode_audio
+    return decode_audio(file_path, sampling_rate=16000)
+
 
 class Transcriber:
     """
     Class for audio transcription using faster-whisper.
     """
     def __init__(self):
-        self.transcription_thread = None
         self.is_transcribing = False
         self.model = None
+        self.pipeline = None
         self.current_model_name = None
         self.current_device = None
+        self.requested_device = None
+        self.current_precision = None
         self.cancel_requested = False
         self.start_time = 0
 
-    def transcribe(self, file_path, config, progress_callback=None, completion_callback=None, error_callback=None):
+        # One long-lived worker runs every transcription, so a request costs
+        # a queue put instead of a new thread, and the CUDA context stays on
+        # the same thread between files.
+        self.jobs = Queue()
+        self.idle = threading.Event()
+        self.idle.set()
+        self.state_lock = threading.Lock()
+        self.transcription_thread = threading.Thread(target=self._worker_loop)
+        self.transcription_thread.daemon = True
+        self.transcription_thread.start()
+
+    def transcribe(self, file_path, config, progress_callback=None, completion_callback=None, error_callback=None,
+                   audio=None):
         """
-        Starts transcription of an audio file (runs in a background thread).
+        Starts transcription of an audio file (runs on the worker thread).
 
         Args:
             file_path (str): Path to the audio file
-            config (dict): Transcription settings (language, model, device)
+            config (dict): Transcription settings (language, model, device, precision)
             progress_callback (callable): called as (percent:int, status:str)
             completion_callback (callable): called as (text:str)
             error_callback (callable): called as (message:str)
+            audio (numpy.ndarray): The file already decoded by load_audio;
+                if given, it is transcribed instead of reading file_path
         """
-        if self.is_transcribing:
+        # The GUI thread and the batch thread may both call this; the check
+        # and the claim must be one step
+        with self.state_lock:
+            busy = self.is_transcribing
+            if not busy:
+                self.is_transcribing = True
+                self.idle.clear()
+        if busy:
             if error_callback:
                 error_callback("A transcription is already in progress.")
             return
 
-        self.is_transcribing = True
         self.cancel_requested = False
         self.start_time = time.time()
 
-        self.transcription_thread = threading.Thread(
-            target=self._transcribe_thread,
-            args=(file_path, config, progress_callback, completion_callback, error_callback)
-        )
-        self.transcription_thread.daemon = True
-        self.transcription_thread.start()
+        self.jobs.put((
+            self._transcribe_thread,
+            (file_path, config, progress_callback, completion_callback, error_callback, audio)
+        ))
 
-    def _load_model(self, model_name, device):
+    def preload(self, model_name, device, precision="auto"):
         """
-        Loads (and caches) a WhisperModel. On CPU we use int8 for speed and
-        low memory; on CUDA we use float16. Falls back to CPU if a CUDA load
-        fails (e.g. no NVIDIA runtime present).
+        Loads a model in the background (on the worker thread), so the first
+        transcription does not pay for it. Transcriptions queued afterwards
+        wait for the load and then reuse the model.
+
+        Args:
+            model_name (str): Whisper model name
+            device (str): "cpu" or "cuda"
+            precision (str): "auto" (int8 quantized) or "full"
         """
-        resolved = _MODEL_ALIASES.get(model_name, model_name)
+        self.jobs.put((self._preload, (model_name, device, precision)))
 
-        if self.model is not None and self.current_model_name == model_name and self.current_device == device:
-            return  # already loaded
+    def probe_cuda(self, callback):
+        """
+        Checks for a CUDA device on the worker thread, which imports
+        CTranslate2 anyway, so the GUI thread never pays for that import.
 
-        def _build(dev):
-            compute_type = "float16" if dev == "cuda" else "int8"
-            return WhisperModel(resolved, device=dev, compute_type=compute_type)
+        Args:
+            callback (callable): called as (available:bool)
+        """
+        self.jobs.put((self._probe_cuda, (callback,)))
+
+    def wait(self):
+        """
+        Blocks until the current transcription has finished, whether it
+        completed, failed or was canceled.
+        """
+        self.idle.wait()
 
+    def _worker_loop(self):
+        while True:
+            job, args = self.jobs.get()
+            job(*args)
+
+    def _preload(self, model_name, device, precision):
         try:
-            self.model = _build(device)
-            self.current_device = device
+            self._load_model(model_name, device, precision)
         except Exception:
-            # CUDA requested but unavailable -> fall back to CPU int8.
-            self.model = _build("cpu")
-            self.current_device = "cpu"
+            pass  # the transcription that needs it will report the error
+
+    def _probe_cuda(self, callback):
+        callback(cuda_available())
 
+    def _load_model(self, model_name, device, precision="auto"):
+        """
+        Loads a WhisperModel, or takes it from the shared cache. On CPU we use
+        int8 for speed and low memory; on CUDA int8 weights with bfloat16 or
+        float16 activations (see _compute_type).
+        """
+        if (self.model is not None and self.current_model_name == model_name
+                and self.requested_device == device and self.current_precision == precision):
+            return  # already loaded
+
+        from faster_whisper import BatchedInferencePipeline
+
+        self.model, self.current_device = _get_model(model_name, device, precision)
+        # Batched decoding wraps the model once, not once per file
+        self.pipeline = BatchedInferencePipeline(model=self.model) if self.current_device == "cuda" else None
         self.current_model_name = model_name
+        self.requested_device = device
+        self.current_precision = precision
 
-    def _transcribe_thread(self, file_path, config, progress_callback, completion_callback, error_callback):
+    def _transcribe_thread(self, file_path, config, progress_callback, completion_callback, error_callback, audio):
         try:
-            if not os.path.isfile(file_path):
+            if audio is None and not os.path.isfile(file_path):
                 if error_callback:
                     error_callback(f"File not found: {file_path}")
                 return
@@ -90,11 +287,12 @@ class Transcriber:
             model_name = config.get("model", "base")
             language = config.get("language", "auto")
             device = config.get("device", "cpu")
+            precision = config.get("precision", "auto")
 
             if progress_callback:
                 progress_callback(5, f"Loading model '{model_name}'...")
 
-            self._load_model(model_name, device)
+            self._load_model(model_name, device, precision)
 
             if self.cancel_requested:
                 return
@@ -110,7 +308,14 @@ class Transcriber:
                 progress_callback(10, "Analyzing audio...")
 
             # segments is a lazy generator; work happens as we iterate it.
-            segments, info = self.model.transcribe(file_path, **options)
+            source = file_path if audio is None else audio
+            if self.pipeline is not None:
+                # Decode the VAD chunks in batches to fill the GPU instead of
+                # running the 30 s windows one after another.
+                options["batch_size"] = config.get("batch_size", DEFAULT_BATCH_SIZE)
+                segments, info = self.pipeline.transcribe(source, **options)
+            else:
+                segments, info = self.model.transcribe(source, **options)
             duration = info.duration or 0
 
             text_parts = []
@@ -148,7 +353,11 @@ class Transcriber:
                 error_callback(f"Transcription error: {str(e)}")
 
         finally:
-            self.is_transcribing = False
+            # Drop the flag before waking wait(): a caller that transcribes
+            # again as soon as it wakes must not find it still set.
+            with self.state_lock:
+                self.is_transcribing = False
+                self.idle.set()
 
     def cancel(self):
         """
@@ -164,8 +373,15 @@ def format_time(seconds):
     """
     Formats a duration in seconds as a short human-readable string.
     """
-    minutes, seconds = divmod(int(seconds), 60)
-    hours, minutes = divmod(minutes, 60)
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_whole_seconds(seconds):
+    # Progress updates repeat the same whole-second values (e.g. the total
+    # duration on every segment), so the formatted strings are cached.
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
 
     if hours > 0:
         return f"{hours}h {minutes}min {seconds}s"
@@ -2,19 +2,24 @@
 Backend module for downloading YouTube videos.
 """
 import os
-import subprocess
 import threading
 from pathlib import Path
+from queue import Queue
 
 class YouTubeDownloader:
     """
-    Class for downloading YouTube videos using yt-dlp.
+    Class for downloading YouTube videos using yt-dlp (as a library).
     """
     def __init__(self):
-        self.download_thread = None
         self.is_downloading = False
-        self.current_process = None
+        self.cancel_requested = False
         self.download_path = str(Path.home() / "Downloads")
+        
+        # One long-lived worker runs every download
+        self.jobs = Queue()
+        self.download_thread = threading.Thread(target=self._worker_loop)
+        self.download_thread.daemon = True
+        self.download_thread.start()
     
     def download(self, url, progress_callback=None, completion_callback=None, error_callback=None):
         """
@@ -32,14 +37,14 @@ class YouTubeDownloader:
             return
         
         self.is_downloading = True
+        self.cancel_requested = False
         
-        # Start download thread
-        self.download_thread = threading.Thread(
-            target=self._download_thread,
-            args=(url, progress_callback, completion_callback, error_callback)
-        )
-        self.download_thread.daemon = True
-        self.download_thread.start()
+        # Hand the download to the worker thread
+        self.jobs.put((url, progress_callback, completion_callback, error_callback))
+    
+    def _worker_loop(self):
+        while True:
+            self._download_thread(*self.jobs.get())
     
     def _download_thread(self, url, progress_callback, completion_callback, error_callback):
         """
@@ -51,63 +56,58 @@ class YouTubeDownloader:
             completion_callback (callable): Callback function for download completion
             error_callback (callable): Callback function for errors
         """
+        try:
+            # yt-dlp is optional: only YouTube input needs it
+            from yt_dlp import YoutubeDL
+            from yt_dlp.utils import DownloadCancelled, DownloadError
+        except ImportError:
+            if error_callback:
+                error_callback("yt-dlp is not installed. Install it with: pip install yt-dlp")
+            self.is_downloading = False
+            return
+        
         try:
             # Create downloads directory if it doesn't exist
             os.makedirs(self.download_path, exist_ok=True)
             
-            # Command to download only audio (mp3 format)
-            cmd = [
-                "yt-dlp",
-                "-f", "bestaudio",
-                "-x",
-                "--audio-format", "mp3",
-                "--audio-quality", "0",
-                "--newline",
-                "--progress",
-                "-o", f"{self.download_path}/%(title)s.%(ext)s",
-                url
-            ]
-            
-            # Start process
-            self.current_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Monitor output for progress updates
             output_file = None
-            for line in self.current_process.stdout:
-                if "[download]" in line and "%" in line:
-                    try:
-                        # Extract percentage progress
-                        percent_str = line.split("%")[0].split()[-1]
-                        percent = float(percent_str)
-                        if progress_callback:
-                            progress_callback(int(percent))
-                    except (ValueError, IndexError):
-                        pass
+            
+            def progress_hook(status):
+                nonlocal output_file
+                if self.cancel_requested:
+                    raise DownloadCancelled()
                 
-                # Capture output file name
-                if "Destination:" in line:
-                    try:
-                        output_file = line.split("Destination: ")[1].strip()
-                    except (IndexError, AttributeError):
-                        pass
+                if status["status"] == "downloading":
+                    total = status.get("total_bytes") or status.get("total_bytes_estimate")
+                    if progress_callback and total:
+                        progress_callback(int(status.get("downloaded_bytes", 0) * 100 // total))
+                elif status["status"] == "finished":
+                    # Capture output file name
+                    output_file = status.get("filename")
+            
+            # Download only audio, in its native codec (opus/m4a).
+            # No mp3 re-encode: the transcriber decodes any format directly.
+            options = {
+                "format": "bestaudio",
+                "outtmpl": f"{self.download_path}/%(title)s.%(ext)s",
+                "progress_hooks": [progress_hook],
+                "quiet": True,
+                "noprogress": True,
+            }
             
-            # Check return code
-            return_code = self.current_process.wait()
+            # Runs in-process: no yt-dlp startup per download, no output parsing
+            with YoutubeDL(options) as ydl:
+                ydl.download([url])
             
-            if return_code == 0:
-                if completion_callback:
-                    completion_callback(output_file)
-            else:
-                error_message = self.current_process.stderr.read()
-                if error_callback:
-                    error_callback(f"Download error: {error_message}")
+            if completion_callback:
+                completion_callback(output_file)
+        
+        except DownloadCancelled:
+            pass
+        
+        except DownloadError as e:
+            if error_callback:
+                error_callback(f"Download error: {str(e)}")
         
         except Exception as e:
             if error_callback:
@@ -115,20 +115,15 @@ class YouTubeDownloader:
         
         finally:
             self.is_downloading = False
-            self.current_process = None
     
     def cancel(self):
         """
-        Cancels the ongoing download.
+        Cancels the ongoing download. The download stops at the next
+        progress update.
         """
-        if self.is_downloading and self.current_process:
-            try:
-                self.current_process.terminate()
-                self.current_process = None
-                self.is_downloading = False
-                return True
-            except Exception:
-                return False
+        if self.is_downloading:
+            self.cancel_requested = True
+            return True
         return False
 
 
@@ -5,9 +5,20 @@ Installs the Python dependencies (PySide6 + faster-whisper). faster-whisper
 bundles its own audio decoder, so there is no separate FFmpeg or PyTorch step.
 """
 import os
+import re
 import sys
 import subprocess
 import platform
+import shutil
+from importlib import metadata
+
+# Needed only to create the Windows desktop shortcut.
+SHORTCUT_PACKAGES = ("pywin32", "winshell")
+
+PYTHON = sys.executable
+IS_WINDOWS = platform.system() == "Windows"
+
+REQUIREMENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements.txt")
 
 
 def print_header(text):
@@ -31,11 +42,57 @@ def check_python_version():
     return True
 
 
-def install_dependencies():
+def _version_tuple(version):
+    return tuple(int(part) for part in re.findall(r"\d+", version.split("+")[0])[:3])
+
+
+def is_installed(requirement):
+    """
+    Returns True if a requirement line ("name" or "name>=version") is
+    already satisfied. Anything more complex counts as not satisfied, so
+    pip gets to decide.
+    """
+    name, _, minimum = requirement.partition(">=")
+    if not re.fullmatch(r"[A-Za-z0-9._-]+", name.strip()):
+        return False
+    try:
+        installed = metadata.version(name.strip())
+    except metadata.PackageNotFoundError:
+        return False
+    return not minimum or _version_tuple(installed) >= _version_tuple(minimum)
+
+
+def read_requirements():
+    with open(REQUIREMENTS_FILE, encoding="utf-8") as f:
+        lines = (line.split("#")[0].strip() for line in f)
+        return [line for line in lines if line]
+
+
+def install_dependencies(extra_packages=()):
+    """
+    Installs requirements.txt plus any extra packages in a single pip run,
+    so the resolver starts once and sees every constraint together.
+    """
     print_step("Installing dependencies")
-    requirements = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements.txt")
+
+    # uv, when available, resolves and downloads in parallel and is much
+    # faster than pip; any failure falls through to the pip path below.
+    uv = shutil.which("uv")
+    if uv:
+        result = subprocess.run(
+            [uv, "pip", "install", "--python", PYTHON, "--upgrade",
+             "-r", REQUIREMENTS_FILE, *extra_packages]
+        )
+        if result.returncode == 0:
+            print("Dependencies installed successfully (uv).")
+            return True
+        print("uv failed, retrying with pip...")
+
+    # --prefer-binary: never pick a newer sdist over an existing wheel.
+    # CTranslate2, PyAV and PySide6 would need a long native build otherwise.
     result = subprocess.run(
-        [sys.executable, "-m", "pip", "install", "--upgrade", "-r", requirements]
+        [PYTHON, "-m", "pip", "install", "--upgrade", "--prefer-binary",
+         "-r", REQUIREMENTS_FILE, *extra_packages]
     )
     if result.returncode == 0:
         print("Dependencies installed successfully.")
@@ -47,10 +104,6 @@ def install_dependencies():
 def create_shortcut_windows():
     print_step("Creating application shortcut")
     try:
-        subprocess.run(
-            [sys.executable, "-m", "pip", "install", "pywin32", "winshell"],
-            check=False,
-        )
         import winshell
         from win32com.client import Dispatch
 
@@ -59,7 +112,7 @@ def create_shortcut_windows():
 
         shell = Dispatch("WScript.Shell")
         shortcut = shell.CreateShortCut(path)
-        shortcut.Targetpath = sys.executable
+        shortcut.Targetpath = PYTHON
         shortcut.Arguments = os.path.join(here, "main.py")
         shortcut.WorkingDirectory = here
         shortcut.save()
@@ -74,10 +127,21 @@ def main():
     if not check_python_version():
         return
 
-    if not install_dependencies():
+    force = "--force" in sys.argv[1:]
+
+    # The shortcut helpers come down with everything else in one pip call,
+    # and only when missing: they are not worth an upgrade check each run.
+    extra_packages = []
+    if IS_WINDOWS:
+        extra_packages = [p for p in SHORTCUT_PACKAGES if force or not is_installed(p)]
+
+    # Re-runs skip pip entirely when nothing is missing; --force reinstalls.
+    if not force and not extra_packages and all(is_installed(r) for r in read_requirements()):
+        print_step("Dependencies already installed (run with --force to upgrade)")
+    elif not install_dependencies(extra_packages):
         return
 
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         create_shortcut_windows()
 
     print_header("Installation Complete")
@@ -3,11 +3,13 @@ Main application file for the transcription app.
 """
 import sys
 import os
+import threading
 import time
 from pathlib import Path
+from queue import Queue
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QObject, Signal, Slot, QThreadPool, Qt
+from PySide6.QtWidgets import QAbstractButton, QApplication, QMessageBox
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot, QThreadPool, Qt
 
 from ui.main_window import MainWindow
 from ui.media_input import MediaInput
@@ -17,9 +19,29 @@ from ui.progress_bar import ProgressBar
 from ui.text_viewer import TextView
 
 from core.transcriber import Transcriber
-from core.batch_processor import BatchProcessor
+from core.batch_processor import BatchProcessor, ProgressThrottle
 from core.file_manager import FileManager
 
+# Seconds between batch list updates while a folder scan is streaming in
+SCAN_FLUSH_INTERVAL = 0.1
+
+# Minimum seconds between single-file progress updates at the same
+# percentage: one per ~30 Hz frame, since a single file is the only thing
+# on screen moving
+PROGRESS_EMIT_INTERVAL_SINGLE = 1 / 30
+
+class FolderScanTask(QRunnable):
+    """
+    Thread pool task that scans a folder for media files.
+    """
+    def __init__(self, controller, folder_path):
+        super().__init__()
+        self.controller = controller
+        self.folder_path = folder_path
+    
+    def run(self):
+        self.controller.scan_folder(self.folder_path)
+
 class ApplicationController(QObject):
     """
     Main application controller, managing communication between UI and backend.
@@ -28,6 +50,8 @@ class ApplicationController(QObject):
     update_progress = Signal(int, str)
     update_status = Signal(str)
     update_text_view = Signal(str)
+    batch_items_found = Signal(list)
+    cuda_probed = Signal(bool)
     processing_started = Signal()
     processing_finished = Signal()
     
@@ -36,22 +60,40 @@ class ApplicationController(QObject):
         
         # Initialize backend components
         self.transcriber = Transcriber()
-        self.batch_processor = BatchProcessor(self.transcriber)
+        self.batch_processor = BatchProcessor(self.transcriber, parent=self)
         self.file_manager = FileManager()
         
         # Current configuration
         self.current_config = {
             'language': 'auto',
             'model': 'base',
-            'device': 'cpu'
+            'device': 'cpu',
+            'precision': 'auto'
         }
         
+        # Load the default model while the user is still picking a file
+        self.transcriber.preload(
+            self.current_config['model'],
+            self.current_config['device'],
+            self.current_config['precision']
+        )
+        
         # When True, batch items are saved and advanced without prompting.
         self.auto_continue = False
+        
+        # Items of the running batch, as passed to process_batch
+        self.batch_items = []
 
         # Thread pool for background operations
         self.thread_pool = QThreadPool()
         
+        # Transcripts are saved by one writer thread, so a slow disk never
+        # holds up the transcriber's worker
+        self.write_jobs = Queue()
+        self.writer_thread = threading.Thread(target=self._writer_loop)
+        self.writer_thread.daemon = True
+        self.writer_thread.start()
+        
         # Connect batch processor signals
         self.batch_processor.signals.item_progress.connect(self.on_batch_item_progress)
         self.batch_processor.signals.batch_progress.connect(self.on_batch_progress)
@@ -75,6 +117,7 @@ class ApplicationController(QObject):
         self.setup_transcription_config()
         self.setup_progress_bar()
         self.setup_text_viewer()
+        self.setup_confirmation_box()
         
         # Connect global signals
         self.update_progress.connect(self.progress_bar.set_progress)
@@ -105,6 +148,7 @@ class ApplicationController(QObject):
         # Connect signals
         self.batch_list.batch_process_requested.connect(self.process_batch)
         self.batch_list.folder_selected.connect(self.add_folder_to_batch)
+        self.batch_items_found.connect(self.batch_list.add_items)
     
     def setup_transcription_config(self):
         """
@@ -115,6 +159,10 @@ class ApplicationController(QObject):
         
         # Connect signals
         self.transcription_config.config_changed.connect(self.update_config)
+        self.cuda_probed.connect(self.transcription_config.set_cuda_available)
+        
+        # Probe for CUDA on the transcriber's worker, after the preload
+        self.transcriber.probe_cuda(self.cuda_probed.emit)
     
     def setup_progress_bar(self):
         """
@@ -133,11 +181,42 @@ class ApplicationController(QObject):
         self.text_viewer = TextView()
         self.main_window.bottom_layout.addWidget(self.text_viewer)
         
+        # Connect signals
+        self.text_viewer.status_message.connect(self.update_status)
+        
         # Remove placeholder
         if hasattr(self.main_window, 'text_view_placeholder'):
             self.main_window.text_view_placeholder.setParent(None)
             self.main_window.text_view_placeholder = None
     
+    def setup_confirmation_box(self):
+        """
+        Builds the batch confirmation dialog once; each item only updates
+        its text.
+        """
+        self.pending_confirmation = None
+        
+        self.confirm_box = QMessageBox(self.main_window)
+        self.confirm_box.setWindowTitle("Transcription Confirmation")
+        self.confirm_box.setInformativeText("Do you want to save this transcription and continue to the next item?")
+
+        # Buttons in English
+        self.btn_save_continue = self.confirm_box.addButton("Save and Continue", QMessageBox.YesRole)
+        self.btn_save_stop = self.confirm_box.addButton("Save and Stop", QMessageBox.NoRole)
+        self.btn_cancel = self.confirm_box.addButton("Cancel", QMessageBox.RejectRole)
+
+        # Size each button to fit its label (the global stylesheet's min-width
+        # would otherwise clip longer text like "Save and Continue").
+        for btn in (self.btn_save_continue, self.btn_save_stop, self.btn_cancel):
+            btn.setMinimumWidth(btn.fontMetrics().horizontalAdvance(btn.text()) + 44)
+
+        self.confirm_box.setDefaultButton(self.btn_save_continue)
+        
+        # Connect signals. finished also fires when the box is closed from
+        # the title bar, which clicks no button
+        self.confirm_box.buttonClicked.connect(self.on_confirmation_clicked)
+        self.confirm_box.finished.connect(self.on_confirmation_finished)
+    
     @Slot(dict)
     def update_config(self, config):
         """
@@ -159,33 +238,31 @@ class ApplicationController(QObject):
         if not file_path:
             return
         
-        if not os.path.isfile(file_path):
-            self.update_status.emit(f"File not found: {file_path}")
-            return
-        
+        # No blocking work on the GUI thread: Transcriber.transcribe only
+        # queues the job, and its worker reports a missing file through
+        # error_callback.
         self.processing_started.emit()
         self.update_status.emit(f"Starting transcription: {file_path}")
         
+        # The transcript goes next to the source file
+        output_path = str(Path(file_path).with_suffix(".txt"))
+        
         # Configure callbacks
+        throttle = ProgressThrottle(PROGRESS_EMIT_INTERVAL_SINGLE)
+        
         def progress_callback(percent, status=None):
+            # Coalesce updates, as batch mode does: each emit is a queued
+            # call into the GUI thread
+            if not throttle.should_emit(percent):
+                return
             self.update_progress.emit(percent, status or f"Transcription: {percent}%")
         
         def completion_callback(text):
             self.update_status.emit("Transcription completed")
             self.update_text_view.emit(text)
             
-            # Automatically save the text file
-            try:
-                output_dir = os.path.dirname(file_path)
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
-                output_path = os.path.join(output_dir, f"{base_name}.txt")
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
-                
-                self.update_status.emit(f"Transcription saved to: {output_path}")
-            except Exception as e:
-                self.update_status.emit(f"Error saving transcription: {str(e)}")
+            # Automatically save the text file (on the writer thread)
+            self.write_jobs.put((output_path, text))
             
             self.processing_finished.emit()
         
@@ -202,6 +279,15 @@ class ApplicationController(QObject):
             error_callback=error_callback
         )
     
+    def _writer_loop(self):
+        while True:
+            output_path, text = self.write_jobs.get()
+            try:
+                FileManager.write_text_atomic(text, output_path)
+                self.update_status.emit(f"Transcription saved to: {output_path}")
+            except Exception as e:
+                self.update_status.emit(f"Error saving transcription: {str(e)}")
+    
     @Slot(str)
     def add_folder_to_batch(self, folder_path):
         """
@@ -210,19 +296,43 @@ class ApplicationController(QObject):
         Args:
             folder_path (str): Folder path
         """
-        if not folder_path or not os.path.isdir(folder_path):
+        if not folder_path:
             self.update_status.emit("Invalid folder")
             return
         
-        # Find all media files in the folder
-        media_files = self.file_manager.find_media_files_in_folder(folder_path)
+        # Scan in the background; files show up in the list as they are found
+        self.update_status.emit(f"Scanning folder: {folder_path}")
+        self.thread_pool.start(FolderScanTask(self, folder_path))
+    
+    def scan_folder(self, folder_path):
+        """
+        Streams the media files of a folder into the batch list. Runs on a
+        thread pool thread; the list is only touched through queued signals.
         
-        # Add files to batch
-        if media_files:
-            for file_path in media_files:
-                self.batch_list.add_item(file_path)
-            
-            self.update_status.emit(f"Added {len(media_files)} files to batch")
+        Args:
+            folder_path (str): Folder path
+        """
+        if not os.path.isdir(folder_path):
+            self.update_status.emit("Invalid folder")
+            return
+        
+        # Hand paths over in chunks: one list update per chunk, not per file
+        count = 0
+        chunk = []
+        last_flush = time.monotonic()
+        for file_path in self.file_manager.iter_media_files_in_folder(folder_path):
+            chunk.append(file_path)
+            count += 1
+            now = time.monotonic()
+            if now - last_flush >= SCAN_FLUSH_INTERVAL:
+                self.batch_items_found.emit(chunk)
+                chunk = []
+                last_flush = now
+        if chunk:
+            self.batch_items_found.emit(chunk)
+        
+        if count:
+            self.update_status.emit(f"Added {count} files to batch")
         else:
             self.update_status.emit("No media files found in folder")
     
@@ -261,12 +371,13 @@ class ApplicationController(QObject):
 
         # Read the auto-save choice made before the batch started.
         self.auto_continue = self.batch_list.is_auto_continue()
+        self.batch_items = list(items)
 
         self.processing_started.emit()
         self.update_status.emit(f"Starting batch processing: {len(items)} items")
 
         # Start batch processing
-        self.batch_processor.process_batch(items, self.current_config)
+        self.batch_processor.process_batch(self.batch_items, self.current_config)
     
     @Slot(int, int, str)
     def on_batch_item_progress(self, index, percent, status):
@@ -301,15 +412,14 @@ class ApplicationController(QObject):
             file_path (str): Processed file path
             output_path (str): Output file path
         """
-        file_name = os.path.basename(file_path)
         self.update_status.emit(f"Transcription saved to: {output_path}")
         
         # Clear the viewer area
         self.update_text_view.emit("")
         
         # Notify that it's proceeding to the next item
-        if self.batch_processor.current_item_index < len(self.batch_list.get_all_items()) - 1:
-            next_file = self.batch_list.get_all_items()[self.batch_processor.current_item_index + 1]
+        if index < len(self.batch_items) - 1:
+            next_file = self.batch_items[index + 1]
             next_file_name = os.path.basename(next_file)
             self.update_status.emit(f"Proceeding to next item: {next_file_name}")
     
@@ -322,6 +432,7 @@ class ApplicationController(QObject):
             results (dict): Batch processing results
         """
         self.update_status.emit(f"Batch processing completed: {len(results)} items")
+        self.batch_items = []
         self.processing_finished.emit()
     
     @Slot(str)
@@ -352,40 +463,38 @@ class ApplicationController(QObject):
             self.batch_processor.confirm_and_continue(True, file_path, text)
             return
 
-        # Show confirmation dialog
+        # Fill in the confirmation dialog
         file_name = os.path.basename(file_path)
-        msg_box = QMessageBox(self.main_window)
-        msg_box.setWindowTitle("Transcription Confirmation")
-        msg_box.setText(f"Transcription for file '{file_name}' completed.")
-        msg_box.setInformativeText("Do you want to save this transcription and continue to the next item?")
-
-        # Buttons in English
-        btn_save_continue = msg_box.addButton("Save and Continue", QMessageBox.YesRole)
-        btn_save_stop = msg_box.addButton("Save and Stop", QMessageBox.NoRole)
-        btn_cancel = msg_box.addButton("Cancel", QMessageBox.RejectRole)
-
-        # Size each button to fit its label (the global stylesheet's min-width
-        # would otherwise clip longer text like "Save and Continue").
-        for btn in (btn_save_continue, btn_save_stop, btn_cancel):
-            btn.setMinimumWidth(btn.fontMetrics().horizontalAdvance(btn.text()) + 44)
-
-        msg_box.setDefaultButton(btn_save_continue)
+        self.pending_confirmation = (file_path, text)
+        self.confirm_box.setText(f"Transcription for file '{file_name}' completed.")
         
         # Add file details
         details = f"File: {file_path}\n"
         details += f"Transcription size: {len(text)} characters\n"
         details += f"First 100 characters: {text[:100]}..."
-        msg_box.setDetailedText(details)
+        self.confirm_box.setDetailedText(details)
         
-        # Execute dialog
-        msg_box.exec()
+        # Window-modal, without a nested event loop; the answer arrives
+        # in on_confirmation_clicked
+        self.confirm_box.open()
+    
+    @Slot(QAbstractButton)
+    def on_confirmation_clicked(self, clicked_button):
+        """
+        Handler for the confirmation dialog's buttons.
         
-        clicked_button = msg_box.clickedButton()
+        Args:
+            clicked_button (QAbstractButton): The button that was clicked
+        """
+        if self.pending_confirmation is None:
+            return
+        file_path, text = self.pending_confirmation
+        self.pending_confirmation = None
         
-        if clicked_button == btn_save_continue:
+        if clicked_button == self.btn_save_continue:
             # Save and continue
             self.batch_processor.confirm_and_continue(True, file_path, text)
-        elif clicked_button == btn_save_stop:
+        elif clicked_button == self.btn_save_stop:
             # Save and stop processing
             self.batch_processor.confirm_and_continue(True, file_path, text)
             # Cancel batch processing after saving current item
@@ -394,6 +503,20 @@ class ApplicationController(QObject):
             # Cancel batch processing
             self.cancel_operation()
     
+    @Slot(int)
+    def on_confirmation_finished(self, result):
+        """
+        Handler for the confirmation dialog closing. A dismissal without a
+        button (title bar close) counts as Cancel; otherwise the batch
+        thread would wait for an answer forever.
+        
+        Args:
+            result (int): Dialog result code
+        """
+        if self.pending_confirmation is None:
+            return  # answered through on_confirmation_clicked
+        self.on_confirmation_clicked(self.btn_cancel)
+    
     @Slot()
     def cancel_operation(self):
         """
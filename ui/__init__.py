@@ -1,3 +1,3 @@
 """
-Pacote de interface do usuário para o aplicativo de transcrição.
+User interface package for the transcription application.
 """
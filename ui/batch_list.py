@@ -1,11 +1,13 @@
 """
 Batch processing list component for the transcription application.
 """
+import os
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QMessageBox, QFileDialog, QCheckBox
+    QListView, QAbstractItemView, QMessageBox, QFileDialog, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QStringListModel, Signal, Slot
 
 class BatchList(QWidget):
     """
@@ -38,9 +40,19 @@ class BatchList(QWidget):
         
         self.layout.addLayout(add_layout)
         
-        # File list
-        self.file_list = QListWidget()
+        # File list: a plain string model instead of one QListWidgetItem
+        # per row, so large folders stay cheap to hold and to paint
+        self.file_model = QStringListModel(self)
+        self.file_list = QListView()
+        self.file_list.setObjectName("batchFileList")
+        self.file_list.setModel(self.file_model)
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.file_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.layout.addWidget(self.file_list)
+        
+        # Normalized paths of the listed items, for O(1) duplicate checks
+        self.item_keys = set()
 
         # Auto-save option: when checked, the batch saves every transcription
         # and moves on without asking for confirmation per file.
@@ -70,30 +82,69 @@ class BatchList(QWidget):
         # Update button states
         self._update_button_states()
     
-    def add_item(self, path):
+    @staticmethod
+    def _item_key(path):
+        # String-only normalization: no filesystem access on the GUI thread
+        return os.path.normcase(os.path.abspath(path))
+    
+    def add_item(self, path, notify_duplicate=True):
         """
-        Adds an item to the batch list.
+        Adds an item to the batch list, unless it is already there.
         
         Args:
             path (str): File path or YouTube URL
+            notify_duplicate (bool): If True, tells the user about a duplicate
         """
         # Check if the item already exists in the list
-        for i in range(self.file_list.count()):
-            if self.file_list.item(i).text() == path:
+        key = self._item_key(path)
+        if key in self.item_keys:
+            if notify_duplicate:
                 QMessageBox.information(
                     self,
                     "Duplicate Item",
                     "This item is already in the processing list."
                 )
-                return
+            return
+        self.item_keys.add(key)
         
         # Add new item
-        item = QListWidgetItem(path)
-        self.file_list.addItem(item)
+        row = self.file_model.rowCount()
+        self.file_model.insertRow(row)
+        self.file_model.setData(self.file_model.index(row), path)
+        
+        # Update button states
+        self._update_button_states()
+    
+    @Slot(list)
+    def add_items(self, paths):
+        """
+        Adds several items at once, e.g. a chunk of a folder scan: one row
+        insertion and one button update for the whole chunk. Duplicates
+        (e.g. from adding the same folder twice) are skipped silently
+        instead of one dialog each.
+        
+        Args:
+            paths (list): File paths
+        """
+        new_paths = []
+        for path in paths:
+            key = self._item_key(path)
+            if key not in self.item_keys:
+                self.item_keys.add(key)
+                new_paths.append(path)
+        
+        if not new_paths:
+            return
+        
+        row = self.file_model.rowCount()
+        self.file_model.insertRows(row, len(new_paths))
+        for offset, path in enumerate(new_paths):
+            self.file_model.setData(self.file_model.index(row + offset), path)
         
         # Update button states
         self._update_button_states()
     
+    @Slot()
     def on_add_folder_clicked(self):
         """
         Handler for the add folder button click.
@@ -107,33 +158,36 @@ class BatchList(QWidget):
         if folder_path:
             self.folder_selected.emit(folder_path)
     
+    @Slot()
     def on_process_all_clicked(self):
         """
         Handler for the process all button click.
         """
-        if self.file_list.count() > 0:
-            items = [self.file_list.item(i).text() for i in range(self.file_list.count())]
-            self.batch_process_requested.emit(items)
+        if self.file_model.rowCount() > 0:
+            self.batch_process_requested.emit(self.file_model.stringList())
     
+    @Slot()
     def on_remove_selected_clicked(self):
         """
         Handler for the remove selected button click.
         """
-        selected_items = self.file_list.selectedItems()
-        if selected_items:
-            for item in selected_items:
-                row = self.file_list.row(item)
-                self.file_list.takeItem(row)
+        selected_rows = self.file_list.selectionModel().selectedRows()
+        if selected_rows:
+            # Bottom-up, so earlier removals don't shift the remaining rows
+            for row in sorted((index.row() for index in selected_rows), reverse=True):
+                self.item_keys.discard(self._item_key(self.file_model.index(row).data()))
+                self.file_model.removeRow(row)
                 self.item_removed.emit(row)
             
             # Update button states
             self._update_button_states()
     
+    @Slot()
     def on_clear_all_clicked(self):
         """
         Handler for the clear list button click.
         """
-        if self.file_list.count() > 0:
+        if self.file_model.rowCount() > 0:
             confirm = QMessageBox.question(
                 self,
                 "Confirm Clear",
@@ -143,19 +197,26 @@ class BatchList(QWidget):
             )
             
             if confirm == QMessageBox.Yes:
-                self.file_list.clear()
+                self.file_model.setStringList([])
+                self.item_keys.clear()
                 # Update button states
                 self._update_button_states()
     
+    def _on_selection_changed(self, selected, deselected):
+        """
+        Enables "Remove Selected" only while something is selected.
+        """
+        self.remove_selected_button.setEnabled(self.file_list.selectionModel().hasSelection())
+    
     def _update_button_states(self):
         """
         Updates the state of buttons based on the list content.
         """
-        has_items = self.file_list.count() > 0
+        has_items = self.file_model.rowCount() > 0
         self.process_all_button.setEnabled(has_items)
         self.clear_all_button.setEnabled(has_items)
         
-        has_selection = len(self.file_list.selectedItems()) > 0
+        has_selection = self.file_list.selectionModel().hasSelection()
         self.remove_selected_button.setEnabled(has_selection)
     
     def get_all_items(self):
@@ -165,7 +226,7 @@ class BatchList(QWidget):
         Returns:
             list: List of file paths/URLs
         """
-        return [self.file_list.item(i).text() for i in range(self.file_list.count())]
+        return self.file_model.stringList()
 
     def is_auto_continue(self):
         """
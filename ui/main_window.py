@@ -1,14 +1,24 @@
 """
 Main interface component for the transcription application.
 """
+import functools
 import os
 
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QMainWindow, QWidget, QVBoxLayout,
     QTabWidget, QSplitter, QLabel, QStatusBar
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QIcon, QFont
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), "resources", "style.qss")
+
+
+@functools.lru_cache(maxsize=1)
+def _read_stylesheet():
+    # Read once per process; a failed read raises and is not cached
+    with open(STYLESHEET_PATH, "r", encoding="utf-8") as f:
+        return f.read()
 
 class MainWindow(QMainWindow):
     """
@@ -45,10 +55,8 @@ class MainWindow(QMainWindow):
         """
         Loads the dark blue theme stylesheet.
         """
-        qss_path = os.path.join(os.path.dirname(__file__), "resources", "style.qss")
         try:
-            with open(qss_path, "r", encoding="utf-8") as f:
-                self.setStyleSheet(f.read())
+            self.setStyleSheet(_read_stylesheet())
         except Exception as e:
             print(f"Error loading stylesheet: {e}")
     
@@ -5,7 +5,15 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QFileDialog, QGroupBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal, Slot
+
+from core.file_manager import MEDIA_EXTENSIONS
+
+# Built from the same extension set the folder scan uses, so the dialog
+# never offers a file the batch would reject (or hides one it accepts)
+MEDIA_FILE_FILTER = (
+    "Media Files (" + " ".join(f"*{ext}" for ext in sorted(MEDIA_EXTENSIONS)) + ");;All Files (*)"
+)
 
 class MediaInput(QWidget):
     """
@@ -83,6 +91,7 @@ class MediaInput(QWidget):
         # Add spacer to push everything up
         self.layout.addStretch()
     
+    @Slot()
     def on_browse_clicked(self):
         """
         Handler for the browse file button click.
@@ -91,13 +100,14 @@ class MediaInput(QWidget):
             self,
             "Select Audio/Video File",
             "",
-            "Media Files (*.mp3 *.mp4 *.wav *.ogg *.flac *.avi *.mov *.mkv *.webm);;All Files (*)"
+            MEDIA_FILE_FILTER
         )
         
         if file_path:
             self.file_path_input.setText(file_path)
             self.file_selected.emit(file_path)
     
+    @Slot()
     def on_browse_folder_clicked(self):
         """
         Handler for the browse folder button click.
@@ -112,12 +122,14 @@ class MediaInput(QWidget):
             self.file_path_input.setText(folder_path)
             self.folder_selected.emit(folder_path)
     
+    @Slot()
     def on_clear_clicked(self):
         """
         Handler for the clear button click.
         """
         self.file_path_input.clear()
     
+    @Slot()
     def on_transcribe_clicked(self):
         """
         Handler for the transcribe button click.
@@ -126,6 +138,7 @@ class MediaInput(QWidget):
         if file_path:
             self.file_selected.emit(file_path)
     
+    @Slot()
     def on_add_to_batch_file_clicked(self):
         """
         Handler for the add file to batch button click.
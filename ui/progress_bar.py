@@ -5,9 +5,12 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton,
     QFrame
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QFont
 
+# Activity indicator frames, cycled by the animation timer
+ANIMATION_SYMBOLS = ("⏳", "⌛")
+
 class ProgressBar(QWidget):
     """
     Widget to display progress and status of operations.
@@ -63,10 +66,14 @@ class ProgressBar(QWidget):
         self.activity_indicator.setVisible(False)
         self.layout.addWidget(self.activity_indicator)
         
-        # Timer for activity indicator animation
+        # Timer for activity indicator animation: a steady 4 Hz while an
+        # operation runs, independent of how often progress arrives
         self.animation_counter = 0
-        self.animation_symbols = ["⏳", "⌛", "⏳", "⌛"]
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(250)
+        self.animation_timer.timeout.connect(self._advance_animation)
     
+    @Slot(int, str)
     def set_progress(self, value, detailed_status=None):
         """
         Sets the progress bar value.
@@ -79,15 +86,15 @@ class ProgressBar(QWidget):
         
         if detailed_status:
             self.detailed_status_label.setText(detailed_status)
-            
-        # Update activity indicator
-        if value > 0 and value < 100:
-            self.activity_indicator.setVisible(True)
-            self.animation_counter = (self.animation_counter + 1) % len(self.animation_symbols)
-            self.activity_indicator.setText(self.animation_symbols[self.animation_counter])
-        else:
-            self.activity_indicator.setVisible(False)
     
+    def _advance_animation(self):
+        """
+        Shows the next activity indicator symbol.
+        """
+        self.animation_counter = (self.animation_counter + 1) % len(ANIMATION_SYMBOLS)
+        self.activity_indicator.setText(ANIMATION_SYMBOLS[self.animation_counter])
+    
+    @Slot(str)
     def set_status(self, text):
         """
         Sets the status text.
@@ -97,13 +104,16 @@ class ProgressBar(QWidget):
         """
         self.status_label.setText(text)
     
+    @Slot()
     def start_operation(self):
         """
         Starts an operation, enabling the cancel button.
         """
         self.cancel_button.setEnabled(True)
         self.activity_indicator.setVisible(True)
+        self.animation_timer.start()
     
+    @Slot()
     def finish_operation(self):
         """
         Finishes an operation, disabling the cancel button.
@@ -113,7 +123,9 @@ class ProgressBar(QWidget):
         self.status_label.setText("Ready")
         self.detailed_status_label.setText("")
         self.activity_indicator.setVisible(False)
+        self.animation_timer.stop()
     
+    @Slot()
     def on_cancel_clicked(self):
         """
         Handler for the cancel button click.
@@ -2,16 +2,45 @@
 Text viewer component for the transcription application.
 """
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, 
-    QPushButton, QFileDialog, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, 
+    QPushButton, QFileDialog, QMessageBox, QAbstractButton
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtGui import QClipboard, QGuiApplication
 
+from core.file_manager import FileManager
+
+class TextSaveSignals(QObject):
+    """
+    Signals for reporting the outcome of a background save.
+    """
+    saved = Signal(str)  # file path
+    failed = Signal(str)  # error message
+
+class TextSaveTask(QRunnable):
+    """
+    Thread pool task that writes a transcription to disk.
+    """
+    def __init__(self, text, file_path, signals):
+        super().__init__()
+        self.text = text
+        self.file_path = file_path
+        self.signals = signals
+    
+    def run(self):
+        try:
+            FileManager.write_text_atomic(self.text, self.file_path)
+            self.signals.saved.emit(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
 class TextView(QWidget):
     """
     Widget for viewing and exporting transcribed text.
     """
+    # Signals
+    status_message = Signal(str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -19,12 +48,29 @@ class TextView(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         
-        # Text area
-        self.text_edit = QTextEdit()
+        # Text area: plain-text document layout only lays out and paints
+        # the visible blocks, so long transcripts stay responsive
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
+        # Nothing to undo in a read-only view; don't keep a history for it
+        self.text_edit.setUndoRedoEnabled(False)
         self.text_edit.setPlaceholderText("Transcription will appear here")
         self.layout.addWidget(self.text_edit, 1)
         
+        # The editor is read-only, so its text only changes in set_text and
+        # on_clear_clicked; keep a copy rather than re-serializing the whole
+        # document on every button click
+        self.current_text = ""
+        # Bumped on every text change, so a confirmation answered after the
+        # text was replaced can tell
+        self.text_generation = 0
+        self.clear_generation = 0
+        
+        # Saves run on the global thread pool and report back here
+        self.save_signals = TextSaveSignals(self)
+        self.save_signals.saved.connect(self.on_save_finished)
+        self.save_signals.failed.connect(self.on_save_failed)
+        
         # Action buttons
         button_layout = QHBoxLayout()
         
@@ -42,9 +88,22 @@ class TextView(QWidget):
         
         self.layout.addLayout(button_layout)
         
+        # Clear confirmation, built once and shown with open() so the event
+        # loop keeps running (and progress keeps updating) while it is up
+        self.clear_box = QMessageBox(
+            QMessageBox.Question,
+            "Confirm Clear",
+            "Are you sure you want to clear the text?",
+            QMessageBox.Yes | QMessageBox.No,
+            self
+        )
+        self.clear_box.setDefaultButton(QMessageBox.No)
+        self.clear_box.buttonClicked.connect(self.on_clear_confirmed)
+        
         # Update button states
         self._update_button_states()
     
+    @Slot(str)
     def set_text(self, text):
         """
         Sets the text to be displayed.
@@ -52,6 +111,8 @@ class TextView(QWidget):
         Args:
             text (str): Transcribed text
         """
+        self.current_text = text
+        self.text_generation += 1
         self.text_edit.setPlainText(text)
         self._update_button_states()
     
@@ -62,27 +123,28 @@ class TextView(QWidget):
         Returns:
             str: Current text
         """
-        return self.text_edit.toPlainText()
+        return self.current_text
     
+    @Slot()
     def on_copy_clicked(self):
         """
         Handler for the copy button click.
         """
-        text = self.text_edit.toPlainText()
+        text = self.current_text
         if text:
             clipboard = QGuiApplication.clipboard()
-            clipboard.setText(text)
-            QMessageBox.information(
-                self,
-                "Copied",
-                "Text copied to clipboard."
-            )
+            # The regular clipboard only, not the X11 selection
+            clipboard.setText(text, QClipboard.Clipboard)
+            # Report in the status bar; a modal box per copy is just a
+            # click in the way
+            self.status_message.emit("Text copied to clipboard.")
     
+    @Slot()
     def on_save_clicked(self):
         """
         Handler for the save button click.
         """
-        text = self.text_edit.toPlainText()
+        text = self.current_text
         if text:
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
@@ -96,44 +158,72 @@ class TextView(QWidget):
                 if not file_path.lower().endswith(".txt"):
                     file_path += ".txt"
                 
-                try:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(text)
-                    
-                    QMessageBox.information(
-                        self,
-                        "Saved",
-                        f"Transcription saved to {file_path}"
-                    )
-                except Exception as e:
-                    QMessageBox.critical(
-                        self,
-                        "Error",
-                        f"Error saving file: {str(e)}"
-                    )
+                # Write off the GUI thread; the result comes back through
+                # save_signals
+                QThreadPool.globalInstance().start(
+                    TextSaveTask(text, file_path, self.save_signals)
+                )
+    
+    @Slot(str)
+    def on_save_finished(self, file_path):
+        """
+        Handler for a completed save.
+        
+        Args:
+            file_path (str): Path of the saved file
+        """
+        QMessageBox.information(
+            self,
+            "Saved",
+            f"Transcription saved to {file_path}"
+        )
+    
+    @Slot(str)
+    def on_save_failed(self, error_msg):
+        """
+        Handler for a failed save.
+        
+        Args:
+            error_msg (str): Error message
+        """
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error saving file: {error_msg}"
+        )
     
+    @Slot()
     def on_clear_clicked(self):
         """
         Handler for the clear button click.
         """
-        if self.text_edit.toPlainText():
-            confirm = QMessageBox.question(
-                self,
-                "Confirm Clear",
-                "Are you sure you want to clear the text?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if confirm == QMessageBox.Yes:
-                self.text_edit.clear()
-                self._update_button_states()
+        if self.current_text:
+            self.clear_generation = self.text_generation
+            self.clear_box.open()
+    
+    @Slot(QAbstractButton)
+    def on_clear_confirmed(self, button):
+        """
+        Handler for the clear confirmation buttons.
+        
+        Args:
+            button (QAbstractButton): The button that was clicked
+        """
+        if self.clear_box.standardButton(button) != QMessageBox.Yes:
+            return
+        # The confirmation was for the text shown when it opened; a newer
+        # transcript that arrived meanwhile is kept
+        if self.clear_generation == self.text_generation:
+            self.current_text = ""
+            self.text_generation += 1
+            self.text_edit.clear()
+            self._update_button_states()
     
     def _update_button_states(self):
         """
         Updates the state of buttons based on the text content.
         """
-        has_text = bool(self.text_edit.toPlainText())
+        has_text = bool(self.current_text)
         self.copy_button.setEnabled(has_text)
         self.save_button.setEnabled(has_text)
         self.clear_button.setEnabled(has_text)
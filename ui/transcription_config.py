@@ -5,11 +5,34 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
     QGroupBox, QRadioButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
+
+# (label, value) pairs for the combo boxes
+LANGUAGES = (
+    ("Automatic Detection", "auto"),
+    ("Portuguese", "pt"),
+    ("English", "en"),
+    ("Spanish", "es"),
+    ("French", "fr"),
+    ("German", "de"),
+    ("Italian", "it"),
+    ("Japanese", "ja"),
+    ("Chinese", "zh"),
+    ("Russian", "ru"),
+    ("Arabic", "ar"),
+)
+
+MODELS = (
+    ("Tiny (fast speed, lower accuracy)", "tiny"),
+    ("Base (balance of speed and accuracy)", "base"),
+    ("Small (good accuracy, moderate speed)", "small"),
+    ("Medium (high accuracy, slow speed)", "medium"),
+    ("Large (maximum accuracy, very slow speed)", "large"),
+)
 
 class TranscriptionConfig(QWidget):
     """
-    Widget for transcription settings (language, model, device).
+    Widget for transcription settings (language, model, device, precision).
     """
     # Signals
     config_changed = Signal(dict)
@@ -20,6 +43,8 @@ class TranscriptionConfig(QWidget):
         # Main layout
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
+        # Keep the sections at the top without a stretch item in the layout
+        self.layout.setAlignment(Qt.AlignTop)
         
         # Language configuration
         self.setup_language_section()
@@ -30,14 +55,12 @@ class TranscriptionConfig(QWidget):
         # Device configuration
         self.setup_device_section()
         
-        # Add spacer to push everything up
-        self.layout.addStretch()
-        
         # Initial configuration
         self.current_config = {
             'language': 'auto',
             'model': 'base',
-            'device': 'cuda' if self.cuda_radio.isChecked() else 'cpu'
+            'device': 'cuda' if self.cuda_radio.isChecked() else 'cpu',
+            'precision': 'auto'
         }
     
     def setup_language_section(self):
@@ -55,18 +78,11 @@ class TranscriptionConfig(QWidget):
         language_layout.addWidget(language_desc)
         
         # Language combobox
+        # Filled before currentIndexChanged is connected, so population
+        # emits nothing
         self.language_combo = QComboBox()
-        self.language_combo.addItem("Automatic Detection", "auto")
-        self.language_combo.addItem("Portuguese", "pt")
-        self.language_combo.addItem("English", "en")
-        self.language_combo.addItem("Spanish", "es")
-        self.language_combo.addItem("French", "fr")
-        self.language_combo.addItem("German", "de")
-        self.language_combo.addItem("Italian", "it")
-        self.language_combo.addItem("Japanese", "ja")
-        self.language_combo.addItem("Chinese", "zh")
-        self.language_combo.addItem("Russian", "ru")
-        self.language_combo.addItem("Arabic", "ar")
+        for label, value in LANGUAGES:
+            self.language_combo.addItem(label, value)
         
         self.language_combo.currentIndexChanged.connect(self.on_config_changed)
         language_layout.addWidget(self.language_combo)
@@ -90,14 +106,11 @@ class TranscriptionConfig(QWidget):
         
         # Model combobox
         self.model_combo = QComboBox()
-        self.model_combo.addItem("Tiny (fast speed, lower accuracy)", "tiny")
-        self.model_combo.addItem("Base (balance of speed and accuracy)", "base")
-        self.model_combo.addItem("Small (good accuracy, moderate speed)", "small")
-        self.model_combo.addItem("Medium (high accuracy, slow speed)", "medium")
-        self.model_combo.addItem("Large (maximum accuracy, very slow speed)", "large")
+        for label, value in MODELS:
+            self.model_combo.addItem(label, value)
         
-        # Set "base" model as default (index 1)
-        self.model_combo.setCurrentIndex(1)
+        # Set "base" model as default
+        self.model_combo.setCurrentIndex(self.model_combo.findData("base"))
         
         self.model_combo.currentIndexChanged.connect(self.on_config_changed)
         model_layout.addWidget(self.model_combo)
@@ -135,23 +148,53 @@ class TranscriptionConfig(QWidget):
         
         device_layout.addLayout(device_layout_h)
         
-        # Connect signals
+        # Precision: quantized by default, full precision as a fallback for
+        # audio where int8 costs accuracy
+        self.precision_combo = QComboBox()
+        self.precision_combo.addItem("Quantized (int8, fastest)", "auto")
+        self.precision_combo.addItem("Full precision (slower, more memory)", "full")
+        device_layout.addWidget(self.precision_combo)
+        
+        # Connect signals. The two radios are exclusive, so cuda_radio
+        # toggles on every switch; listening to both would emit twice.
         self.cuda_radio.toggled.connect(self.on_config_changed)
-        self.cpu_radio.toggled.connect(self.on_config_changed)
+        self.precision_combo.currentIndexChanged.connect(self.on_config_changed)
         
         # Add to main layout
         self.layout.addWidget(device_group)
     
+    @Slot(bool)
+    def set_cuda_available(self, available):
+        """
+        Applies the result of the CUDA probe. Without a CUDA device the GPU
+        option could only fail the model load and fall back to CPU, so it
+        is not offered at all.
+        
+        Args:
+            available (bool): Whether a CUDA device was found
+        """
+        if available:
+            return
+        if self.cuda_radio.isChecked():
+            self.cpu_radio.setChecked(True)
+        self.cuda_radio.setEnabled(False)
+        self.cuda_radio.setToolTip("CUDA not available")
+    
+    @Slot()
     def on_config_changed(self):
         """
         Handler for configuration changes.
         """
-        self.current_config = {
+        config = {
             'language': self.language_combo.currentData(),
             'model': self.model_combo.currentData(),
-            'device': 'cuda' if self.cuda_radio.isChecked() else 'cpu'
+            'device': 'cuda' if self.cuda_radio.isChecked() else 'cpu',
+            'precision': self.precision_combo.currentData()
         }
+        if config == self.current_config:
+            return
         
+        self.current_config = config
         self.config_changed.emit(self.current_config)
     
     def get_config(self):